@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from enum import IntEnum
 
+from mashumaro import field_options
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 from pymammotion.proto.mctrl_nav import AreaHashName, NavGetCommDataAck
@@ -14,10 +15,17 @@ class PathType(IntEnum):
     PATH = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameList(DataClassORJSONMixin):
     total_frame: int
     data: list[NavGetCommDataAck]
+    # current_frame of each frame in data, rebuilt from data on load
+    seen: set[int] = field(default_factory=set, repr=False, compare=False, metadata=field_options(serialize="omit"))
+
+    def __post_init__(self) -> None:
+        """Rebuild the seen frames when loaded without them."""
+        if not self.seen and self.data:
+            self.seen = {frame.current_frame for frame in self.data}
 
 
 @dataclass
@@ -28,7 +36,7 @@ class AreaHashNameList(DataClassORJSONMixin):
     hash: int
 
 
-@dataclass
+@dataclass(slots=True)
 class HashList(DataClassORJSONMixin):
     """stores our map data.
     [hashID, FrameList].
@@ -40,54 +48,68 @@ class HashList(DataClassORJSONMixin):
     obstacle: dict = field(default_factory=dict)  # type 1
     hashlist: list[int] = field(default_factory=list)
     area_name: list[AreaHashNameList] = field(default_factory=list)
+    _buckets: dict[int, dict] = field(
+        default_factory=dict, init=False, repr=False, compare=False, metadata=field_options(serialize="omit")
+    )
+
+    def __post_init__(self) -> None:
+        """Index the frame dicts by path type."""
+        self._index_buckets()
+
+    def _index_buckets(self) -> None:
+        """Map each PathType to the dict holding its frames."""
+        self._buckets = {
+            PathType.AREA: self.area,
+            PathType.OBSTACLE: self.obstacle,
+            PathType.PATH: self.path,
+        }
 
     def set_hashlist(self, hashlist: list[int]) -> None:
         self.hashlist = hashlist
-        self.area = {hash_id: frames for hash_id, frames in self.area.items() if hash_id in hashlist}
-        self.path = {hash_id: frames for hash_id, frames in self.path.items() if hash_id in hashlist}
-        self.obstacle = {hash_id: frames for hash_id, frames in self.obstacle.items() if hash_id in hashlist}
+        hash_ids = set(hashlist)
+        self.area = {hash_id: frames for hash_id, frames in self.area.items() if hash_id in hash_ids}
+        self.path = {hash_id: frames for hash_id, frames in self.path.items() if hash_id in hash_ids}
+        self.obstacle = {hash_id: frames for hash_id, frames in self.obstacle.items() if hash_id in hash_ids}
+        self._index_buckets()
 
     def missing_frame(self, hash_data: NavGetCommDataAck) -> list[int]:
-        if hash_data.type == PathType.AREA:
-            return self._find_missing_frames(self.area.get(hash_data.hash))
-
-        if hash_data.type == PathType.OBSTACLE:
-            return self._find_missing_frames(self.obstacle.get(hash_data.hash))
-
-        if hash_data.type == PathType.PATH:
-            return self._find_missing_frames(self.path.get(hash_data.hash))
+        bucket = self._buckets.get(hash_data.type)
+        if bucket is not None:
+            return self._find_missing_frames(bucket.get(hash_data.hash))
 
     def update(self, hash_data: NavGetCommDataAck) -> bool:
         """Update the map data."""
-        if hash_data.type == PathType.AREA:
+        path_type = hash_data.type
+        bucket = self._buckets.get(path_type)
+        if bucket is None:
+            return False
+
+        if path_type == PathType.AREA:
             existing_name = next((area for area in self.area_name if area.hash == hash_data.hash), None)
             if not existing_name:
                 self.area_name.append(AreaHashName(name=f"area {len(self.area_name)+1}", hash=hash_data.hash))
-            return self._add_hash_data(self.area, hash_data)
-
-        if hash_data.type == PathType.OBSTACLE:
-            return self._add_hash_data(self.obstacle, hash_data)
-
-        if hash_data.type == PathType.PATH:
-            return self._add_hash_data(self.path, hash_data)
+        return self._add_hash_data(bucket, hash_data)
 
     @staticmethod
     def _find_missing_frames(frame_list: FrameList) -> list[int]:
         if frame_list.total_frame == len(frame_list.data):
             return []
-        number_list = list(range(1, frame_list.total_frame + 1))
 
-        current_frames = {frame.current_frame for frame in frame_list.data}
-        missing_numbers = [num for num in number_list if num not in current_frames]
-        return missing_numbers
+        current_frames = frame_list.seen
+        return [num for num in range(1, frame_list.total_frame + 1) if num not in current_frames]
 
     @staticmethod
     def _add_hash_data(hash_dict: dict, hash_data: NavGetCommDataAck) -> bool:
-        if hash_dict.get(hash_data.hash) is None:
-            hash_dict[hash_data.hash] = FrameList(total_frame=hash_data.total_frame, data=[hash_data])
+        current_frame = hash_data.current_frame
+        frame_list: FrameList | None = hash_dict.get(hash_data.hash)
+        if frame_list is None:
+            hash_dict[hash_data.hash] = FrameList(
+                total_frame=hash_data.total_frame, data=[hash_data], seen={current_frame}
+            )
             return True
 
-        if hash_data not in hash_dict[hash_data.hash].data:
-            hash_dict[hash_data.hash].data.append(hash_data)
+        if current_frame not in frame_list.seen:
+            frame_list.seen.add(current_frame)
+            frame_list.data.append(hash_data)
             return True
         return False
@@ -4,24 +4,28 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from functools import cache
-from typing import Any
+from typing import Any, Callable
+from weakref import WeakKeyDictionary
 
 from aiohttp import ClientSession
 from bleak.backends.device import BLEDevice
 
 from pymammotion.aliyun.cloud_gateway import CloudIOTGateway
-from pymammotion.aliyun.dataclass.dev_by_account_response import Device
+from pymammotion.aliyun.dataclass.dev_by_account_response import Device, ListingDevByAccountResponse
 from pymammotion.const import MAMMOTION_DOMAIN
 from pymammotion.data.model.account import Credentials
 from pymammotion.data.model.device import MowingDevice
 from pymammotion.http.http import connect_http
+from pymammotion.mammotion.devices.base import MammotionBaseDevice
 from pymammotion.mammotion.devices.mammotion_bluetooth import MammotionBaseBLEDevice
 from pymammotion.mammotion.devices.mammotion_cloud import MammotionBaseCloudDevice, MammotionCloud
 from pymammotion.mqtt import MammotionMQTT
 
 TIMEOUT_CLOUD_RESPONSE = 10
+_MAMMOTION_PREFIXES = ("Luba-", "Yuka-")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,7 +52,9 @@ class MammotionMixedDeviceManager:
         mqtt: MammotionCloud | None = None,
         preference: ConnectionPreference = ConnectionPreference.BLUETOOTH,
     ) -> None:
-        self.name = name
+        # names become MammotionDevices keys, interning lets lookups with the same name match on identity
+        # bleak reports unnamed devices with a name of None, keep accepting those as before
+        self.name = sys.intern(name) if isinstance(name, str) else name
         self._mowing_state = MowingDevice()
         self.add_ble(ble_device)
         self.add_cloud(cloud_device, mqtt)
@@ -63,6 +69,13 @@ class MammotionMixedDeviceManager:
     def cloud(self) -> MammotionBaseCloudDevice | None:
         return self._cloud_device
 
+    def preferred_device(self) -> MammotionBaseDevice | None:
+        """Return the BLE or cloud device matching the connection preference."""
+        accessor = _PREFERENCE_TO_ACCESSOR.get(self.preference)
+        if accessor is not None:
+            return accessor(self)
+        return None
+
     def add_ble(self, ble_device: BLEDevice) -> None:
         if ble_device is not None:
             self._ble_device = MammotionBaseBLEDevice(self._mowing_state, ble_device)
@@ -89,8 +102,20 @@ class MammotionMixedDeviceManager:
         return self._ble_device is not None
 
 
+_PREFERENCE_TO_ACCESSOR: dict[
+    ConnectionPreference, Callable[[MammotionMixedDeviceManager], MammotionBaseDevice | None]
+] = {
+    ConnectionPreference.BLUETOOTH: MammotionMixedDeviceManager.ble,
+    ConnectionPreference.WIFI: MammotionMixedDeviceManager.cloud,
+}
+
+
 class MammotionDevices:
-    devices: dict[str, MammotionMixedDeviceManager] = {}
+    devices: dict[str, MammotionMixedDeviceManager]
+
+    def __init__(self) -> None:
+        """Initialize MammotionDevices."""
+        self.devices = {}
 
     def add_device(self, mammotion_device: MammotionMixedDeviceManager) -> None:
         exists: MammotionMixedDeviceManager | None = self.devices.get(mammotion_device.name)
@@ -108,13 +133,12 @@ class MammotionDevices:
     def remove_device(self, name) -> None:
         device_for_removal = self.devices.pop(name)
         if device_for_removal.has_cloud():
-            should_disconnect = {
-                device
-                for key, device in self.devices.items()
-                if device.cloud() is not None and device.cloud()._mqtt == device_for_removal.cloud()._mqtt
-            }
-            if len(should_disconnect) == 0:
-                device_for_removal.cloud()._mqtt.disconnect()
+            target_mqtt = device_for_removal.cloud()._mqtt
+            for device in self.devices.values():
+                cloud = device.cloud()
+                if cloud is not None and cloud._mqtt is target_mqtt:
+                    return
+            target_mqtt.disconnect()
 
 
 async def create_devices(
@@ -133,14 +157,14 @@ async def create_devices(
     return mammotion
 
 
-@cache
 class Mammotion:
     """Represents a Mammotion account and its devices."""
 
-    devices = MammotionDevices()
-    mqtt_list: dict[str, MammotionCloud] = dict()
+    devices: MammotionDevices
+    mqtt_list: dict[str, MammotionCloud]
 
     _instance = None
+    _initialized = False
 
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
@@ -149,7 +173,18 @@ class Mammotion:
 
     def __init__(self) -> None:
         """Initialize MammotionDevice."""
+        if self._initialized:
+            return
+        self._initialized = True
+        self.devices = MammotionDevices()
+        self.mqtt_list = {}
         self._login_lock = asyncio.Lock()
+        # blocking aliyun SDK calls run here rather than on the loop's shared default executor
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="mammotion-cloud")
+        # cloud client -> (device listing it was filtered from, Luba/Yuka devices in that listing)
+        self._mower_cloud_devices: WeakKeyDictionary[
+            CloudIOTGateway, tuple[ListingDevByAccountResponse, list[Device]]
+        ] = WeakKeyDictionary()
 
     def add_ble_device(
         self, ble_device: BLEDevice, preference: ConnectionPreference = ConnectionPreference.BLUETOOTH
@@ -170,11 +205,12 @@ class Mammotion:
             await self.initiate_cloud_connection(account, cloud_client)
 
     async def initiate_cloud_connection(self, account: str, cloud_client: CloudIOTGateway) -> None:
-        if self.mqtt_list.get(account) is not None:
-            if self.mqtt_list.get(account).is_connected:
-                # we might have removed a device so readd
-                self.add_cloud_devices(self.mqtt_list.get(account))
-                return
+        exists: MammotionCloud | None = self.mqtt_list.get(account)
+        if exists is not None:
+            # reuse the account's client even while it is still connecting, a second client would share its identity
+            # we might have removed a device so readd
+            self.add_cloud_devices(exists)
+            return
 
         self.cloud_client = cloud_client
         mammotion_cloud = MammotionCloud(
@@ -193,30 +229,42 @@ class Mammotion:
         self.add_cloud_devices(mammotion_cloud)
 
         loop = asyncio.get_running_loop()
-        await loop.run_in_executor(None, self.mqtt_list[account].connect_async)
+        await loop.run_in_executor(self._executor, mammotion_cloud.connect_async)
+
+    def _get_mower_cloud_devices(self, mqtt_client: MammotionCloud) -> list[Device]:
+        """Return the Luba/Yuka devices bound to the account, filtered once per device listing."""
+        cloud_client = mqtt_client.cloud_client
+        response = cloud_client.devices_by_account_response
+        cached = self._mower_cloud_devices.get(cloud_client)
+        if cached is not None and cached[0] is response:
+            return cached[1]
+
+        mower_devices = [device for device in response.data.data if device.deviceName.startswith(_MAMMOTION_PREFIXES)]
+        self._mower_cloud_devices[cloud_client] = (response, mower_devices)
+        return mower_devices
 
     def add_cloud_devices(self, mqtt_client: MammotionCloud) -> None:
-        for device in mqtt_client.cloud_client.devices_by_account_response.data.data:
-            mower_device = self.devices.get_device(device.deviceName)
-            if device.deviceName.startswith(("Luba-", "Yuka-")) and mower_device is None:
+        for device in self._get_mower_cloud_devices(mqtt_client):
+            name = device.deviceName
+            mower_device = self.devices.get_device(name)
+            if mower_device is None:
                 self.devices.add_device(
                     MammotionMixedDeviceManager(
-                        name=device.deviceName,
+                        name=name,
                         cloud_device=device,
                         mqtt=mqtt_client,
                         preference=ConnectionPreference.WIFI,
                     )
                 )
-            elif device.deviceName.startswith(("Luba-", "Yuka-")) and mower_device:
-                if mower_device.cloud() is None:
-                    mower_device.add_cloud(cloud_device=device, mqtt=mqtt_client)
-                elif mqtt_client != mower_device.cloud().mqtt:
-                    mower_device.replace_mqtt(mqtt_client)
+            elif mower_device.cloud() is None:
+                mower_device.add_cloud(cloud_device=device, mqtt=mqtt_client)
+            elif mqtt_client is not mower_device.cloud().mqtt:
+                mower_device.replace_mqtt(mqtt_client)
 
     def set_disconnect_strategy(self, disconnect: bool) -> None:
-        for device_name, device in self.devices.devices:
-            if device.ble() is not None:
-                ble_device: MammotionBaseBLEDevice = device.ble()
+        for device in self.devices.devices.values():
+            ble_device: MammotionBaseBLEDevice | None = device.ble()
+            if ble_device is not None:
                 ble_device.set_disconnect_strategy(disconnect)
 
     async def login(self, account: str, password: str) -> CloudIOTGateway:
@@ -230,14 +278,18 @@ class Mammotion:
             loop = asyncio.get_running_loop()
             cloud_client.set_http(mammotion_http)
             await loop.run_in_executor(
-                None, cloud_client.get_region, country_code, mammotion_http.login_info.authorization_code
+                self._executor, cloud_client.get_region, country_code, mammotion_http.login_info.authorization_code
             )
             await cloud_client.connect()
             await cloud_client.login_by_oauth(country_code, mammotion_http.login_info.authorization_code)
-            await loop.run_in_executor(None, cloud_client.aep_handle)
-            await loop.run_in_executor(None, cloud_client.session_by_auth_code)
+            # aep auth and the session only need the region and oauth login, so run them together
+            await asyncio.gather(
+                loop.run_in_executor(self._executor, cloud_client.aep_handle),
+                loop.run_in_executor(self._executor, cloud_client.session_by_auth_code),
+            )
 
-            await loop.run_in_executor(None, cloud_client.list_binding_by_account)
+            # device listing authenticates with the session's iot token
+            await loop.run_in_executor(self._executor, cloud_client.list_binding_by_account)
             return cloud_client
 
     def remove_device(self, name: str) -> None:
@@ -246,43 +298,33 @@ class Mammotion:
     def get_device_by_name(self, name: str) -> MammotionMixedDeviceManager:
         return self.devices.get_device(name)
 
-    async def send_command(self, name: str, key: str):
-        """Send a command to the device."""
+    def _get_preferred_device(self, name: str) -> MammotionBaseDevice | None:
         device = self.get_device_by_name(name)
         if device:
-            if device.preference is ConnectionPreference.BLUETOOTH:
-                return await device.ble().command(key)
-            if device.preference is ConnectionPreference.WIFI:
-                return await device.cloud().command(key)
-            # TODO work with both with EITHER
+            return device.preferred_device()
+        return None
+
+    async def send_command(self, name: str, key: str):
+        """Send a command to the device."""
+        if device := self._get_preferred_device(name):
+            return await device.command(key)
+        # TODO work with both with EITHER
 
     async def send_command_with_args(self, name: str, key: str, **kwargs: Any):
         """Send a command with args to the device."""
-        device = self.get_device_by_name(name)
-        if device:
-            if device.preference is ConnectionPreference.BLUETOOTH:
-                return await device.ble().command(key, **kwargs)
-            if device.preference is ConnectionPreference.WIFI:
-                return await device.cloud().command(key, **kwargs)
-            # TODO work with both with EITHER
+        if device := self._get_preferred_device(name):
+            return await device.command(key, **kwargs)
+        # TODO work with both with EITHER
 
     async def start_sync(self, name: str, retry: int):
-        device = self.get_device_by_name(name)
-        if device:
-            if device.preference is ConnectionPreference.BLUETOOTH:
-                return await device.ble().start_sync(retry)
-            if device.preference is ConnectionPreference.WIFI:
-                return await device.cloud().start_sync(retry)
-            # TODO work with both with EITHER
+        if device := self._get_preferred_device(name):
+            return await device.start_sync(retry)
+        # TODO work with both with EITHER
 
     async def start_map_sync(self, name: str):
-        device = self.get_device_by_name(name)
-        if device:
-            if device.preference is ConnectionPreference.BLUETOOTH:
-                return await device.ble().start_map_sync()
-            if device.preference is ConnectionPreference.WIFI:
-                return await device.cloud().start_map_sync()
-            # TODO work with both with EITHER
+        if device := self._get_preferred_device(name):
+            return await device.start_map_sync()
+        # TODO work with both with EITHER
 
     def mower(self, name: str):
         device = self.get_device_by_name(name)